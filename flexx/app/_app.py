@@ -26,7 +26,6 @@ class ExporterWebSocketDummy:
     export apps to standalone HTML. The object tracks the commands send
     by the app, so that these can be re-played in the exported document.
     """
-    close_code = None
 
     def __init__(self):
         self.commands = []
@@ -34,6 +33,9 @@ class ExporterWebSocketDummy:
     def write_command(self, cmd):
         self.commands.append(cmd)
 
+    def write_commands(self, cmds):
+        self.commands.extend(cmds)
+
 
 class App:
     """ Specification of a Flexx app.
@@ -50,7 +52,7 @@ class App:
     """
 
     def __init__(self, cls, *args, **kwargs):
-        if not isinstance(cls, type) and issubclass(type, (PyComponent, JsComponent)):
+        if not (isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent))):
             raise ValueError('App needs a PyComponent or JsComponent class '
                              'as its first argument.')
         self._cls = cls
@@ -445,13 +447,29 @@ class App:
                 freeze.copy_module(module_name, appdir)
 
 
-# todo: thread safety
+# Note on thread safety: the app manager is modified only from the thread that
+# runs the event loop. Servers that handle requests in other threads (e.g.
+# Flask) hand such work to that loop, and only do plain lookups themselves.
+# Therefore the manager needs no locking.
 
 def valid_app_name(name):
     T = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789'
     return name and name[0] in T[:-10] and all([c in T for c in name])
 
 
+class _AppInfo:
+    """ The app manager's record for one registered app: the App object,
+    and its pending and connected sessions (dicts that map id -> Session).
+    """
+
+    __slots__ = ('app', 'pending', 'connected')
+
+    def __init__(self, app):
+        self.app = app
+        self.pending = {}
+        self.connected = {}
+
+
 # Note that the AppManager is a Component (but not a PyComponent)
 
 class AppManager(event.Component):
@@ -468,9 +486,15 @@ class AppManager(event.Component):
 
     def __init__(self):
         super().__init__()
-        # name -> (app, pending, connected) - lists contain Session objects
-        self._appinfo = {}
+        self._appinfo = {}  # name -> _AppInfo
+        self._app_names_lower = {}  # lowercase name -> name
+        self._app_names_sorted = None  # cache for get_app_names()
         self._session_map = weakref.WeakValueDictionary()
+        # id -> Session for all pending sessions (except the default session),
+        # in order of creation, so that old ones can be found without a full scan
+        self._pending_sessions = {}
+        self._default_session = None
+        self._connections_cache = {}  # name -> tuple of connected sessions
         self._last_check_time = time.time()
 
     def register_app(self, app):
@@ -482,12 +506,15 @@ class AppManager(event.Component):
         name = app.name
         if not valid_app_name(name):
             raise ValueError('Given app does not have a valid name %r' % name)
-        pending, connected = [], []
-        if name in self._appinfo:
-            old_app, pending, connected = self._appinfo[name]
-            if app.cls is not old_app.cls:  # if app is not old_app:
+        info = self._appinfo.get(name, None)
+        if info is None:
+            self._appinfo[name] = _AppInfo(app)
+            self._app_names_lower.setdefault(name.lower(), name)
+            self._app_names_sorted = None
+        else:
+            if app.cls is not info.app.cls:  # if app is not old_app:
                 logger.warning('Re-defining app class %r' % name)
-        self._appinfo[name] = app, pending, connected
+            info.app = app  # keep the sessions
 
     def create_default_session(self, cls=None):
         """ Create a default session for interactive use (e.g. the notebook).
@@ -498,7 +525,7 @@ class AppManager(event.Component):
 
         if cls is None:
             cls = JsComponent
-        if not isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent)):
+        if not (isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent))):
             raise TypeError('create_default_session() needs a JsComponent subclass.')
 
         # Create app and register it by __default__ name
@@ -508,8 +535,8 @@ class AppManager(event.Component):
         # Create the session instance and register it
         session = Session('__default__')
         self._session_map[session.id] = session
-        _, pending, connected = self._appinfo['__default__']
-        pending.append(session)
+        self._appinfo['__default__'].pending[session.id] = session
+        self._default_session = session
 
         # Instantiate the component
         app(flx_session=session, flx_is_app=True)
@@ -522,7 +549,11 @@ class AppManager(event.Component):
         s = self.get_default_session()
         if s is not None:
             s.close()
-        self._appinfo.pop('__default__', None)
+        if self._appinfo.pop('__default__', None) is not None:
+            self._app_names_lower.pop('__default__', None)
+            self._app_names_sorted = None
+        self._connections_cache.pop('__default__', None)
+        self._default_session = None
 
     def get_default_session(self):
         """ Get the default session that is used for interactive use.
@@ -531,29 +562,22 @@ class AppManager(event.Component):
         When a JsComponent class is created without a session, this method
         is called to get one (and will then fail if it's None).
         """
-        x = self._appinfo.get('__default__', None)
-        if x is None:
-            return None
-        else:
-            _, pending, connected = x
-            sessions = pending + connected
-            if sessions:
-                return sessions[-1]
+        return self._default_session
 
     def _clear_old_pending_sessions(self, max_age=30):
         try:
 
-            count = 0
-            for name in self._appinfo:
-                if name == '__default__':
-                    continue
-                _, pending, _ = self._appinfo[name]
-                to_remove = [s for s in pending
-                             if (time.time() - s._creation_time) > max_age]
-                for s in to_remove:
-                    self._session_map.pop(s.id, None)
-                    pending.remove(s)
-                count += len(to_remove)
+            # Sessions are ordered by creation time, so stop at the first young one
+            to_remove = []
+            min_creation_time = time.time() - max_age
+            for s in self._pending_sessions.values():
+                if s._creation_time >= min_creation_time:
+                    break
+                to_remove.append(s)
+            for s in to_remove:
+                self._remove_pending_session(s)
+                self._session_map.pop(s.id, None)
+            count = len(to_remove)
             if count:
                 logger.warning('Cleared %i old pending sessions' % count)
 
@@ -579,7 +603,7 @@ class AppManager(event.Component):
         elif name not in self._appinfo:
             raise ValueError('Can only instantiate a session with a valid app name.')
 
-        app, pending, connected = self._appinfo[name]
+        info = self._appinfo[name]
 
         # Create the session
         session = Session(name, request=request)
@@ -588,36 +612,48 @@ class AppManager(event.Component):
         self._session_map[session.id] = session
         # Instantiate the component
         # This represents the "instance" of the App object (Component class + args)
-        app(flx_session=session, flx_is_app=True)
+        info.app(flx_session=session, flx_is_app=True)
 
         # Now wait for the client to connect. The client will be served
         # a page that contains the session_id. Upon connecting, the id
         # will be communicated, so it connects to the correct session.
-        pending.append(session)
+        info.pending[session.id] = session
+        self._pending_sessions[session.id] = session
 
-        logger.debug('Instantiate app client %s' % session.app_name)
+        logger.debug('Instantiate app client %s', session.app_name)
         return session
 
+    def _remove_pending_session(self, session):
+        """ Remove a session from the pending sessions of its app, and from
+        the global pending sessions.
+        """
+        self._appinfo[session.app_name].pending.pop(session.id, None)
+        self._pending_sessions.pop(session.id, None)
+
+    def _set_session_connected(self, session, ws, cookies=None):
+        """ Move a pending session to the connected sessions of its app,
+        and hook it up with the given websocket.
+        """
+        self._remove_pending_session(session)
+        session._set_cookies(cookies)
+        session._set_ws(ws)
+        self._appinfo[session.app_name].connected[session.id] = session
+        self._connections_cache.pop(session.app_name, None)
+
     def connect_client(self, ws, name, session_id, cookies=None):
         """ Connect a client to a session that was previously created.
         """
-        _, pending, connected = self._appinfo[name]
-        # Search for the session with the specific id
-        for session in pending:
-            if session.id == session_id:
-                pending.remove(session)
-                break
-        else:
+        # Look up the session with the specific id
+        session = self._appinfo[name].pending.get(session_id, None)
+        if session is None:
             raise RuntimeError('Asked for session id %r, but could not find it' %
                                session_id)
 
         # Add app to connected, set ws
         assert session.id == session_id
         assert session.status == Session.STATUS.PENDING
-        logger.info('New session %s %s' % (name, session_id))
-        session._set_cookies(cookies)
-        session._set_ws(ws)
-        connected.append(session)
+        logger.info('New session %s %s', name, session_id)
+        self._set_session_connected(session, ws, cookies)
         AppManager.total_sessions += 1
         self.connections_changed(session.app_name)
         return session  # For the ws
@@ -629,16 +665,15 @@ class AppManager(event.Component):
         The manager will remove the session from the list of connected
         instances.
         """
+        session._set_ws_closed()
         if session.app_name == '__default__':
             logger.info('Default session lost connection to client.')
             return  # The default session awaits a re-connect
 
-        _, pending, connected = self._appinfo[session.app_name]
-        try:
-            connected.remove(session)
-        except ValueError:
-            pass
-        logger.info('Session closed %s %s' %(session.app_name, session.id))
+        self._appinfo[session.app_name].connected.pop(session.id, None)
+        self._connections_cache.pop(session.app_name, None)
+        self._session_map.pop(session.id, None)
+        logger.info('Session closed %s %s', session.app_name, session.id)
         session.close()
         self.connections_changed(session.app_name)
 
@@ -647,17 +682,14 @@ class AppManager(event.Component):
         a registered appliciation (case insensitive). Returns None if the
         given name does not match any applications.
         """
-        name = name.lower()
-        for key in self._appinfo.keys():
-            if key.lower() == name:
-                return key
-        else:
-            return None
+        return self._app_names_lower.get(name.lower(), None)
 
     def get_app_names(self):
         """ Get a list of registered application names.
         """
-        return [name for name in sorted(self._appinfo.keys())]
+        if self._app_names_sorted is None:
+            self._app_names_sorted = sorted(self._appinfo.keys())
+        return list(self._app_names_sorted)
 
     def get_session_by_id(self, id):
         """ Get session object by its id, or None.
@@ -665,10 +697,14 @@ class AppManager(event.Component):
         return self._session_map.get(id, None)
 
     def get_connections(self, name):
-        """ Given an app name, return the connected session objects.
+        """ Given an app name, return a tuple of the connected session objects.
         """
-        _, pending, connected = self._appinfo[name]
-        return list(connected)
+        try:
+            return self._connections_cache[name]
+        except KeyError:
+            connected = self._appinfo[name].connected
+            sessions = self._connections_cache[name] = tuple(connected.values())
+            return sessions
 
     @event.emitter
     def connections_changed(self, name):
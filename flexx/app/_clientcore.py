@@ -374,10 +374,12 @@ class JsSession:
         while self._pending_commands is not None and len(self._pending_commands) > 0:
             msg = self._pending_commands.pop(0)
             try:
-                command = self._receive_raw_command(msg)
+                command = self._receive_queued_command(msg)
             except Exception as err:
                 window.setTimeout(self._process_commands, 0)
                 raise err
+            if command is None:
+                continue  # a batch that got unpacked into the queue
             if command[0] == 'DEFINE':
                 self._asset_count += 1
                 if (self._asset_count % 3) == 0:
@@ -388,6 +390,17 @@ class JsSession:
     def _receive_raw_command(self, msg):
         return self._receive_command(serializer.decode(msg))
 
+    def _receive_queued_command(self, msg):
+        """ Process a queued message, which is either raw or an already
+        decoded command from a batch. A batch is unpacked into the front
+        of the queue, so that its commands are processed one by one.
+        """
+        command = msg if isinstance(msg, list) else serializer.decode(msg)
+        if command[0] == 'MULTI':
+            self._pending_commands = command[1] + self._pending_commands
+            return None
+        return self._receive_command(command)
+
     def _receive_command(self, command):
         """ Process a command send from the server.
         """
@@ -398,9 +411,12 @@ class JsSession:
         elif cmd == 'INIT_DONE':
             window.flexx.spin(None)
             while len(self._pending_commands):
-                self._receive_raw_command(self._pending_commands.pop(0))
+                self._receive_queued_command(self._pending_commands.pop(0))
             self._pending_commands = None
             # print('init took', time() - self._init_time)
+        elif cmd == 'MULTI':
+            for c in command[1]:
+                self._receive_command(c)
         elif cmd == 'PRINT':
             (window.console.ori_log or window.console.log)(command[1])
         elif cmd == 'EXEC':
@@ -260,7 +260,7 @@ class AppHandler(RequestHandler):
 
     def get(self, full_path):
 
-        logger.debug('Incoming request at %r' % full_path)
+        logger.debug('Incoming request at %r', full_path)
 
         ok_app_names = '__main__', '__default__', '__index__'
         parts = [p for p in full_path.split('/') if p]
@@ -371,7 +371,7 @@ class MainHandler(RequestHandler):
 
     def get(self, full_path):
 
-        logger.debug('Incoming request at %s' % full_path)
+        logger.debug('Incoming request at %s', full_path)
 
         # Analyze path to derive components
         # Note: invalid app name can mean its a path relative to the main app
@@ -613,7 +613,7 @@ class WSHandler(MyWebSocketHandler):
             path = path.decode()
         self.app_name = path.strip('/')
 
-        logger.debug('New websocket connection %s' % path)
+        logger.debug('New websocket connection %s', path)
         if manager.has_app_name(self.app_name):
             self.application._io_loop.spawn_callback(self.pinger1)
         else:
@@ -659,7 +659,7 @@ class WSHandler(MyWebSocketHandler):
         """
         self.close_code = code = self.close_code or 0
         reason = self.close_reason or self.known_reasons.get(code, '')
-        logger.debug('Websocket closed: %s (%i)' % (reason, code))
+        logger.debug('Websocket closed: %s (%i)', reason, code)
         self._mps_counter.stop()
         if self._session is not None:
             manager.disconnect_client(self._session)
@@ -714,6 +714,11 @@ class WSHandler(MyWebSocketHandler):
         except flask.Exception:  # Note: is there a more specific error we could use?
             self.close(1000, 'closed by client')
 
+    def write_commands(self, cmds):
+        """ Write multiple commands in a single websocket message.
+        """
+        self.write_command(('MULTI', list(cmds)))
+
     def close(self, *args):
         super().close(*args)
 
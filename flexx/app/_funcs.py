@@ -10,7 +10,6 @@ import webruntime
 from .. import config, set_log_level
 
 from ._app import App, manager
-from ._component2 import PyComponent, JsComponent
 from ._server import current_server
 from ._assetstore import assets
 from ._clientcore import serializer
@@ -78,8 +77,6 @@ class NoteBookHelper:
     node. This way, Flexx widgets keep working in the exported notebook.
     """
 
-    close_code = None
-
     def __init__(self, session):
         self._session = session
         self._real_ws = None
@@ -129,6 +126,9 @@ class NoteBookHelper:
         assert isinstance(cmd, tuple) and len(cmd) >= 1
         self._commands.append(cmd)
 
+    def write_commands(self, cmds):
+        self._commands.extend(cmds)
+
 
 def init_notebook():
     """ Initialize the Jupyter notebook by injecting the necessary CSS
@@ -158,8 +158,8 @@ def init_notebook():
         session = manager.create_default_session()
 
     # Check if already loaded, if so, re-connect
-    if not getattr(session, 'init_notebook_done', False):
-        session.init_notebook_done = True
+    if not session._init_notebook_done:
+        session._init_notebook_done = True
     else:
         display(HTML("<i>Flexx already loaded (the notebook cannot export now)</i>"))
         return  # Don't inject Flexx twice
@@ -214,8 +214,7 @@ def serve(cls, name=None, properties=None):
         raise RuntimeError('serve(... properties) is deprecated, '
                            'use app.App().serve() instead.')
     # Note: this talks to the manager; it has nothing to do with the server
-    assert (isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent)))
-    a = App(cls)
+    a = App(cls)  # validates cls
     a.serve(name)
     return cls
 
@@ -228,8 +227,7 @@ def launch(cls, runtime=None, properties=None, **runtime_kwargs):
                            'use app.App().launch() instead.')
     if isinstance(cls, str):
         return webruntime.launch(cls, runtime, **runtime_kwargs)
-    assert (isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent)))
-    a = App(cls)
+    a = App(cls)  # validates cls
     return a.launch(runtime, **runtime_kwargs)
 
 
@@ -239,6 +237,5 @@ def export(cls, filename, properties=None, **kwargs):
     if properties is not None:
         raise RuntimeError('export(... properties) is deprecated, '
                            'use app.App(...).export() instead.')
-    assert (isinstance(cls, type) and issubclass(cls, (PyComponent, JsComponent)))
-    a = App(cls)
+    a = App(cls)  # validates cls
     return a.export(filename, **kwargs)
@@ -67,8 +67,19 @@ class Session:
 
     """
 
+    # Plain int values (not enum members) to keep status checks cheap
     STATUS = new_type('Enum', (), {'PENDING': 1, 'CONNECTED': 2, 'CLOSED': 0})
 
+    # A server can hold many (idle) sessions; slots keep them small
+    __slots__ = ('_store', '_creation_time', '_id', '_app_name',
+                 '_present_classes', '_present_modules', '_present_assets',
+                 '_assets_to_ignore', '_data', '_runtime', '_ws', '_status',
+                 '_closing', '_component', '_component_counter',
+                 '_component_instances', '_dead_component_ids', '_ping_calls',
+                 '_ping_counter', '_eval_result', '_eval_count',
+                 '_pending_commands', '_request', '_cookies',
+                 '_init_notebook_done', '__weakref__')
+
     def __init__(self, app_name, store=None,
                  request=None):  # Allow custom store for testing
         self._store = store if (store is not None) else assetstore
@@ -92,7 +103,9 @@ class Session:
         # More vars
         self._runtime = None  # init web runtime, will be set when used
         self._ws = None  # init websocket, will be set when a connection is made
+        self._status = self.STATUS.PENDING  # updated when connected and closed
         self._closing = False  # Flag to help with shutdown
+        self._init_notebook_done = False  # Set by init_notebook()
 
         # PyComponent or JsComponent instance, can be None if app_name is __default__
         self._component = None
@@ -110,7 +123,9 @@ class Session:
         self._eval_count = 0
 
         # While the client is not connected, we keep a queue of
-        # commands, which are send to the client as soon as it connects
+        # commands, which are send to the client as soon as it connects.
+        # The commands are not encoded yet, because not every "websocket"
+        # sends them over the wire (e.g. the exporter and notebook helper).
         self._pending_commands = []
 
         # request related information
@@ -165,12 +180,7 @@ class Session:
         * status 2: connected
         * status 0: closed
         """
-        if self._ws is None:
-            return self.STATUS.PENDING  # not connected yet
-        elif self._ws.close_code is None:
-            return self.STATUS.CONNECTED  # alive and kicking
-        else:
-            return self.STATUS.CLOSED  # connection closed
+        return self._status
 
     @property
     def present_modules(self):
@@ -191,6 +201,7 @@ class Session:
         """
         # Stop guarding objects to break down any circular refs
         self._ping_calls = []
+        self._status = self.STATUS.CLOSED
         self._closing = True  # suppress warnings for session being closed.
         try:
             # Close the websocket
@@ -220,14 +231,21 @@ class Session:
         """
         if self._ws is not None:
             raise RuntimeError('Session is already connected.')
-        # Set websocket object - this is what changes the status to CONNECTED
+        # Set websocket object and mark the session as CONNECTED
         self._ws = ws
+        self._status = self.STATUS.CONNECTED
         self._ws.write_command(("PRINT", "Flexx session says hi"))
-        # Send pending commands
-        for command in self._pending_commands:
-            self._ws.write_command(command)
+        # Send pending commands in one go; the queue is not used anymore
+        if self._pending_commands:
+            self._ws.write_commands(self._pending_commands)
+        self._pending_commands = None
         self._ws.write_command(('INIT_DONE', ))
 
+    def _set_ws_closed(self):
+        """ Called (via the app manager) when the websocket is closed.
+        """
+        self._status = self.STATUS.CLOSED
+
     def _set_cookies(self, cookies=None):
         """ To set cookies, must be an http.cookie.SimpleCookie object.
         When the app is loaded as a web app, the cookies are set *before* the
@@ -443,7 +461,7 @@ class Session:
                                    % same_name)
 
         # Mark the class and the module as used
-        logger.debug('Registering Component class %r' % cls.__name__)
+        logger.debug('Registering Component class %r', cls.__name__)
         self._register_module(cls.__jsmodule__)
 
     def _register_module(self, mod_name):
@@ -509,7 +527,7 @@ class Session:
         for asset in assets:
             if asset.name in self._assets_to_ignore:
                 continue
-            logger.debug('Loading asset %s' % asset.name)
+            logger.debug('Loading asset %s', asset.name)
             # Determine command suffix. All our sources come in bundles,
             # for which we use eval because it makes sourceURL work on FF.
             # (It does not work in Chrome in either way.)
@@ -525,12 +543,14 @@ class Session:
         argument (a string representing the type of command).
         """
         assert len(command) >= 1
-        if self._closing:
-            pass
-        elif self.status == self.STATUS.CONNECTED:
+        status = self._status  # a plain int; avoid the property on this hot path
+        # The common case goes first. Note that status is CLOSED while closing.
+        if status == self.STATUS.CONNECTED:
             self._ws.write_command(command)
-        elif self.status == self.STATUS.PENDING:
+        elif status == self.STATUS.PENDING:
             self._pending_commands.append(command)
+        elif self._closing:
+            pass
         else:
             #raise RuntimeError('Cannot send commands; app is closed')
             logger.warning('Cannot send commands; app is closed')
@@ -538,71 +558,98 @@ class Session:
     def _receive_command(self, command):
         """ Received a command from JS.
         """
-        cmd = command[0]
-        if cmd == 'EVALRESULT':
-            self._eval_result[command[2]] = command[1]
-        elif cmd == 'PRINT':
-            print('JS:', command[1])
-        elif cmd == 'INFO':
-            logger.info('JS: ' + command[1])
-        elif cmd == 'WARN':
-            logger.warning('JS: ' + command[1])
-        elif cmd == 'ERROR':
-            logger.error('JS: ' + command[1] +
-                         ' - stack trace in browser console (hit F12).')
-        elif cmd == 'INVOKE':
-            id, name, args = command[1:]
-            ob = self.get_component_instance(id)
-            if ob is None:
-                if id not in self._dead_component_ids:
-                    t = 'Cannot invoke %s.%s; session does not know it (anymore).'
-                    logger.warning(t % (id, name))
-            elif ob._disposed:
-                pass  # JS probably send something before knowing the object was dead
-            else:
-                func = getattr(ob, name, None)
-                if func:
-                    func(*args)
-        elif cmd == 'PONG':
-            self._receive_pong(command[1])
-        elif cmd == 'INSTANTIATE':
-            modulename, cname, id, args, kwargs = command[1:]
-            # Maybe we still have the instance?
-            c = self.get_component_instance(id)
-            if c and not c._disposed:
-                self.keep_alive(c)
-                return
-            # Try to find the class
-            m, cls, e = None, None, 0
-            if modulename in assetstore.modules:
-                m = sys.modules[modulename]
-                cls = getattr(m, cname, None)
-                if cls is None:
-                    e = 1
-                elif not (isinstance(cls, type) and issubclass(cls, JsComponent)):
-                    cls, e = None, 2
-                elif cls not in AppComponentMeta.CLASSES:
-                    cls, e = None, 3
-            if cls is None:
-                raise RuntimeError('Cannot INSTANTIATE %s.%s (%i)' %
-                                   (modulename, cname, e))
-            # Instantiate
-            kwargs['flx_session'] = self
-            kwargs['flx_id'] = id
-            assert len(args) == 0
-            c = cls(**kwargs)  # calls keep_alive via _register_component()
-        elif cmd == 'DISPOSE':  # Gets send from local to proxy
-            id = command[1]
-            c = self.get_component_instance(id)
-            if c and not c._disposed:  # no need to warn if component does not exist
-                c._dispose()
-            self.send_command('DISPOSE_ACK', command[1])
-            self._component_instances.pop(id, None)  # Drop local ref now
-        elif cmd == 'DISPOSE_ACK':  # Gets send from proxy to local
-            self._component_instances.pop(command[1], None)
-            self._dead_component_ids.discard(command[1])
+        handler = self._COMMAND_HANDLERS.get(command[0], None)
+        if handler is None:
+            logger.error('Unknown command received from JS:\n%s', command)
         else:
-            logger.error('Unknown command received from JS:\n%s' % command)
+            handler(self, command)
+
+    def _receive_evalresult(self, command):
+        self._eval_result[command[2]] = command[1]
+
+    def _receive_print(self, command):
+        print('JS:', command[1])
+
+    def _receive_info(self, command):
+        logger.info('JS: %s', command[1])
+
+    def _receive_warn(self, command):
+        logger.warning('JS: %s', command[1])
+
+    def _receive_error(self, command):
+        logger.error('JS: %s - stack trace in browser console (hit F12).',
+                     command[1])
+
+    def _receive_invoke(self, command):
+        # This is the most frequent command, so avoid the method call
+        id, name, args = command[1:]
+        ob = self._component_instances.get(id, None)
+        if ob is None:
+            if id not in self._dead_component_ids:
+                t = 'Cannot invoke %s.%s; session does not know it (anymore).'
+                logger.warning(t % (id, name))
+        elif ob._disposed:
+            pass  # JS probably send something before knowing the object was dead
+        else:
+            func = getattr(ob, name, None)
+            if func:
+                func(*args)
+
+    def _receive_pong_command(self, command):
+        self._receive_pong(command[1])
+
+    def _receive_instantiate(self, command):
+        modulename, cname, id, args, kwargs = command[1:]
+        # Maybe we still have the instance?
+        c = self.get_component_instance(id)
+        if c and not c._disposed:
+            self.keep_alive(c)
+            return
+        # Try to find the class
+        m, cls, e = None, None, 0
+        if modulename in assetstore.modules:
+            m = sys.modules[modulename]
+            cls = getattr(m, cname, None)
+            if cls is None:
+                e = 1
+            elif not (isinstance(cls, type) and issubclass(cls, JsComponent)):
+                cls, e = None, 2
+            elif cls not in AppComponentMeta.CLASSES:
+                cls, e = None, 3
+        if cls is None:
+            raise RuntimeError('Cannot INSTANTIATE %s.%s (%i)' %
+                               (modulename, cname, e))
+        # Instantiate
+        kwargs['flx_session'] = self
+        kwargs['flx_id'] = id
+        assert len(args) == 0
+        c = cls(**kwargs)  # calls keep_alive via _register_component()
+
+    def _receive_dispose(self, command):  # Gets send from local to proxy
+        id = command[1]
+        c = self.get_component_instance(id)
+        if c and not c._disposed:  # no need to warn if component does not exist
+            c._dispose()
+        self.send_command('DISPOSE_ACK', command[1])
+        self._component_instances.pop(id, None)  # Drop local ref now
+
+    def _receive_dispose_ack(self, command):  # Gets send from proxy to local
+        self._component_instances.pop(command[1], None)
+        self._dead_component_ids.discard(command[1])
+
+    # Map command names to their handlers, so that dispatching a command
+    # received from JS is a single dict lookup.
+    _COMMAND_HANDLERS = {'EVALRESULT': _receive_evalresult,
+                         'PRINT': _receive_print,
+                         'INFO': _receive_info,
+                         'WARN': _receive_warn,
+                         'ERROR': _receive_error,
+                         'INVOKE': _receive_invoke,
+                         'PONG': _receive_pong_command,
+                         'INSTANTIATE': _receive_instantiate,
+                         'DISPOSE': _receive_dispose,
+                         'DISPOSE_ACK': _receive_dispose_ack,
+                         }
 
     def keep_alive(self, ob, iters=1):
         """ Keep an object alive for a certain amount of time, expressed
@@ -703,13 +750,21 @@ def send_ping_later(session):
 ## Functions to get page
 # These could be methods, but are only for internal use
 
+_page_parts = None  # The page is the same for each session, except for its id
+
+
 def get_page(session):
     """ Get the string for the HTML page to render this session's app.
     Not a lot; all other JS and CSS assets are pushed over the websocket.
     """
-    css_assets = [assetstore.get_asset('reset.css')]
-    js_assets = [assetstore.get_asset('flexx-core.js')]
-    return _get_page(session, js_assets, css_assets, 3, False)
+    global _page_parts
+    if _page_parts is None:
+        css_assets = [assetstore.get_asset('reset.css')]
+        js_assets = [assetstore.get_asset('flexx-core.js')]
+        template = _get_page(None, js_assets, css_assets, 3, False)
+        _page_parts = template.split('SESSION-HOOK')
+    pre, post = _page_parts
+    return pre + _get_session_script(session) + post
 
 
 def get_page_for_export(session, commands, link=0):
@@ -795,8 +850,8 @@ def _get_page(session, js_assets, css_assets, link, export):
                 codes.append('<script>window.flexx.spin();</script>')
         codes.append('')  # whitespace between css and js assets
 
-    codes.append('<script>flexx.create_session("%s", "%s");</script>\n' %
-                 (session.app_name, session.id))
+    # A None session leaves a hook, so get_page() can reuse the result
+    codes.append(_get_session_script(session) if session else 'SESSION-HOOK')
 
     src = INDEX
     if link in (0, 1):
@@ -808,3 +863,8 @@ def _get_page(session, js_assets, css_assets, link, export):
         src = src.replace('ASSET-HOOK', '\n'.join(codes))
 
     return src
+
+
+def _get_session_script(session):
+    return ('<script>flexx.create_session("%s", "%s");</script>\n' %
+            (session.app_name, session.id))
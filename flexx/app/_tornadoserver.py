@@ -201,7 +201,7 @@ class AppHandler(FlexxHandler):
     @gen.coroutine
     def get(self, full_path):
 
-        logger.debug('Incoming request at %r' % full_path)
+        logger.debug('Incoming request at %r', full_path)
 
         ok_app_names = '__main__', '__default__', '__index__'
         parts = [p for p in full_path.split('/') if p]
@@ -305,7 +305,7 @@ class MainHandler(RequestHandler):
     @gen.coroutine
     def get(self, full_path):
 
-        logger.debug('Incoming request at %s' % full_path)
+        logger.debug('Incoming request at %s', full_path)
 
         # Analyze path to derive components
         # Note: invalid app name can mean its a path relative to the main app
@@ -512,7 +512,7 @@ class WSHandler(WebSocketHandler):
             path = path.decode()
         self.app_name = path.strip('/')
 
-        logger.debug('New websocket connection %s' % path)
+        logger.debug('New websocket connection %s', path)
         if manager.has_app_name(self.app_name):
             self.application._io_loop.spawn_callback(self.pinger1)
         else:
@@ -558,7 +558,7 @@ class WSHandler(WebSocketHandler):
         """
         self.close_code = code = self.close_code or 0
         reason = self.close_reason or self.known_reasons.get(code, '')
-        logger.debug('Websocket closed: %s (%i)' % (reason, code))
+        logger.debug('Websocket closed: %s (%i)', reason, code)
         self._mps_counter.stop()
         if self._session is not None:
             manager.disconnect_client(self._session)
@@ -614,6 +614,11 @@ class WSHandler(WebSocketHandler):
         except WebSocketClosedError:
             self.close(1000, 'closed by client')
 
+    def write_commands(self, cmds):
+        """ Write multiple commands in a single websocket message.
+        """
+        self.write_command(('MULTI', list(cmds)))
+
     def close(self, *args):
         try:
             super().close(*args)
@@ -12,6 +12,17 @@ class MyPropClass2(MyPropClass1):
         self.set_foo(foo_val)
 
 
+def test_app_needs_component_class():
+
+    with raises(ValueError):
+        app.App(3)
+    with raises(ValueError):
+        app.App(int)
+    with raises(ValueError):
+        app.serve(int)
+    assert app.App(MyPropClass1).cls is MyPropClass1
+
+
 def test_launching_with_props():
 
     m = app.launch(MyPropClass1)
@@ -36,4 +47,61 @@ def test_launching_with_init_args():
     m.session.close()
 
 
+class DummyWebSocket:
+
+    def __init__(self):
+        self.commands = []
+
+    def write_command(self, cmd):
+        self.commands.append(cmd)
+
+    def write_commands(self, cmds):
+        self.commands.extend(cmds)
+
+    def close_this(self):
+        pass
+
+
+def test_manager_session_lifecycle():
+
+    a = app.App(MyPropClass1)
+    a.serve('manager_lifecycle')
+    assert 'manager_lifecycle' in app.manager.get_app_names()
+    assert app.manager.has_app_name('Manager_LifeCycle') == 'manager_lifecycle'
+    assert app.manager.has_app_name('manager_lifecycle2') is None
+    s1 = app.manager.create_session('manager_lifecycle')
+    s2 = app.manager.create_session('manager_lifecycle')
+    assert app.manager.get_session_by_id(s1.id) is s1
+    assert app.manager.get_connections('manager_lifecycle') == ()
+
+    with raises(RuntimeError):
+        app.manager.connect_client(DummyWebSocket(), 'manager_lifecycle', 'xx')
+
+    s2.send_command('EXEC', 'foo')
+    ws = DummyWebSocket()
+    assert app.manager.connect_client(ws, 'manager_lifecycle', s2.id) is s2
+    assert ('EXEC', 'foo') in ws.commands
+    assert ws.commands[-1] == ('INIT_DONE', )
+    assert s2.status == s2.STATUS.CONNECTED
+    assert app.manager.get_connections('manager_lifecycle') == (s2, )
+    with raises(RuntimeError):  # cannot connect twice
+        app.manager.connect_client(ws, 'manager_lifecycle', s2.id)
+
+    app.manager.disconnect_client(s2)
+    assert s2.status == s2.STATUS.CLOSED
+    assert app.manager.get_connections('manager_lifecycle') == ()
+    assert app.manager.get_session_by_id(s2.id) is None
+
+    # Old pending sessions are cleared
+    s3 = app.manager.create_session('manager_lifecycle')
+    s3._creation_time += 100
+    app.manager._clear_old_pending_sessions(0)
+    assert app.manager.get_session_by_id(s1.id) is None
+    assert app.manager.get_session_by_id(s3.id) is s3
+    with raises(RuntimeError):
+        app.manager.connect_client(DummyWebSocket(), 'manager_lifecycle', s1.id)
+    s1.close()
+    s3.close()
+
+
 run_tests_if_main()
@@ -6,6 +6,7 @@ import weakref
 import asyncio
 
 from flexx import app
+from flexx.util.logging import capture_log
 from flexx.app import Session
 from flexx.app._assetstore import assets, AssetStore as _AssetStore
 
@@ -23,6 +24,37 @@ def test_session_basics():
     s = Session('xx')
     assert s.app_name == 'xx'
     assert 'xx' in repr(s)
+    assert s.status == s.STATUS.PENDING
+    with raises(AttributeError):  # uses slots
+        s.foo = 3
+    s.close()
+    assert s.status == s.STATUS.CLOSED
+
+
+def test_session_receive_command():
+
+    s = Session('xx')
+    s._receive_command(('EVALRESULT', 42, 7))
+    assert s._eval_result[7] == 42
+
+    with capture_log('info') as log:
+        s._receive_command(('INFO', 'hello'))
+        s._receive_command(('NOTACOMMAND', 'hello'))
+    assert len(log) == 2
+    assert 'JS: hello' in log[0]
+    assert 'Unknown command' in log[1] and 'NOTACOMMAND' in log[1]
+
+
+def test_session_page():
+    from flexx.app._session import get_page
+
+    s1, s2 = Session('xx'), Session('yy')
+    page1, page2 = get_page(s1), get_page(s2)
+    assert 'flexx.create_session("xx", "%s")' % s1.id in page1
+    assert 'flexx.create_session("yy", "%s")' % s2.id in page2
+    assert s1.id not in page2
+    assert 'flexx-core.js' in page1 and 'reset.css' in page1
+    assert 'SESSION-HOOK' not in page1
 
 
 def test_get_component_instance_by_id():
@@ -47,7 +79,6 @@ def test_session_assets_data():
     store = AssetStore()
     store.add_shared_data('ww', b'wwww')
     s = Session('', store)
-    s._send_command = lambda x: None
     assert s.id
 
     # Add data
@@ -101,8 +132,6 @@ def test_session_registering_component_classes():
     store.update_modules()
 
     s = Session('', store)
-    commands = []
-    s._send_command = lambda x: commands.append(x)
     assert not s.present_modules
 
     s._register_component_class(ui.Button)